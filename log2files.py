@@ -27,6 +27,7 @@ import tarfile
 import re
 import webbrowser
 import base64
+import mmap
 from collections import defaultdict
 from pathlib import Path
 import tkinter as tk
@@ -40,6 +41,7 @@ from utils import Config
 
 DEFAULT_CONFIG_PATH = "config.json"
 CURRENT_VERSION = "v1.0.4"
+TIMESTAMP_LINE_PATTERN = re.compile(rb'^(\d{4}.\d{2}.\d{2}.\d{2}.\d{2}.\d{2}.\d{3})', re.MULTILINE)
 
 
 def setup_logging(debug):
@@ -61,11 +63,15 @@ def extract_timestamp(line):
     """Extract the timestamp from a log line and format it for use in filenames."""
     match = re.match(r'^(\d{4}.\d{2}.\d{2}.\d{2}.\d{2}.\d{2}.\d{3})', line)
     if match:
-        timestamp = match.group(1)
-        return timestamp.replace(" ", "_").replace(":", "h", 1).replace(":", "m").replace(",", "s")
+        return format_timestamp(match.group(1))
     return None
 
 
+def format_timestamp(timestamp):
+    """Format a raw log timestamp for use in filenames."""
+    return timestamp.replace(" ", "_").replace(":", "h", 1).replace(":", "m").replace(",", "s")
+
+
 def write_xml_fragment(output_dir, element_number, fragment, timestamp, file_counters):
     """Write a single XML fragment to a uniquely named file."""
     index = file_counters[element_number]
@@ -180,40 +186,42 @@ def process_compressed_log_file(trace_file_path, output_dir, filtered_element_nu
 
 
 def process_log_file(trace_file_path, output_dir, filtered_element_numbers_set, config, file_counters):
-    """Process the log file line by line, extracting and processing XML content."""
-    current_timestamp = None
-    current_fragment = []
-
-    with open(trace_file_path, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-        logging.debug("Starting to process %d lines from the log file", len(lines))
-        for line in tqdm(lines, desc="Processing log lines", unit="line", leave=False):
-            current_timestamp, current_fragment = process_log_line(
-                line, current_timestamp, current_fragment, output_dir, filtered_element_numbers_set, config, file_counters
-            )
-
-    process_final_fragment(current_fragment, current_timestamp, output_dir, filtered_element_numbers_set, config, file_counters)
-
-
-def process_log_line(line, current_timestamp, current_fragment, output_dir, filtered_element_numbers_set, config, file_counters):
-    """Process a single log line, updating the current fragment and timestamp."""
-    timestamp = extract_timestamp(line)
-    if timestamp:
-        if current_fragment:
-            xml_content = "".join(current_fragment)
-            process_xml_content(xml_content, output_dir, filtered_element_numbers_set, config, current_timestamp, file_counters)
-            current_fragment = []
-        current_timestamp = timestamp
-    if current_timestamp:
-        current_fragment.append(line)
-    return current_timestamp, current_fragment
-
-
-def process_final_fragment(current_fragment, current_timestamp, output_dir, filtered_element_numbers_set, config, file_counters):
-    """Process the final XML fragment after all log lines have been read."""
-    if current_fragment:
-        xml_content = "".join(current_fragment)
-        process_xml_content(xml_content, output_dir, filtered_element_numbers_set, config, current_timestamp, file_counters)
+    """Process a plain log file, scanning the memory-mapped bytes for timestamped blocks and XML fragments."""
+    if os.path.getsize(trace_file_path) == 0:
+        logging.debug("Log file %s is empty", trace_file_path)
+        return
+
+    with open(trace_file_path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            memoryview(mapped) as view:
+        logging.debug("Starting to scan %d bytes from the log file", len(mapped))
+        with tqdm(total=len(mapped), desc="Processing log file", unit="B", unit_scale=True, leave=False) as progress:
+            for block_start, block_end, timestamp in iter_log_blocks(mapped):
+                process_log_block(view, block_start, block_end, timestamp, output_dir,
+                                  filtered_element_numbers_set, config, file_counters)
+                progress.update(block_end - block_start)
+
+
+def iter_log_blocks(mapped):
+    """Yield (start, end, timestamp) for each block of lines beginning with a timestamped line."""
+    block_start = None
+    timestamp = None
+    for match in TIMESTAMP_LINE_PATTERN.finditer(mapped):
+        if block_start is not None:
+            yield block_start, match.start(), timestamp
+        block_start = match.start()
+        timestamp = format_timestamp(match.group(1).decode('utf-8'))
+    if block_start is not None:
+        yield block_start, len(mapped), timestamp
+
+
+def process_log_block(view, block_start, block_end, timestamp, output_dir, filtered_element_numbers_set, config, file_counters):
+    """Process the XML fragments found between two offsets of a memory-mapped log file."""
+    for match in config.XML_BYTES_PATTERN.finditer(view, block_start, block_end):
+        fragment = str(view[match.start():match.end()], 'utf-8')
+        if '\r' in fragment:
+            fragment = fragment.replace('\r\n', '\n').replace('\r', '\n')
+        process_xml_fragment(fragment, output_dir, filtered_element_numbers_set, config, timestamp, file_counters)
 
 
 def main(arguments):
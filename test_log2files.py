@@ -3,6 +3,7 @@ from unittest.mock import patch, mock_open, MagicMock
 from collections import defaultdict
 from pathlib import Path
 import tempfile
+import re
 from log2files import (
     extract_element_number, extract_timestamp, write_xml_fragment,
     process_xml_fragment, process_xml_content, read_file_content,
@@ -103,19 +104,39 @@ class TestSimpleLogfileExtractor(unittest.TestCase):
 
         self.assertTrue(mock_process_xml_content.called)
 
-    @patch('log2files.process_xml_content')
-    @patch('builtins.open', new_callable=mock_open, read_data="2024-07-31 12:34:56,789 INFO Some log message")
-    def test_process_files(self, mock_open_obj, mock_process_xml_content):
-        with tempfile.TemporaryDirectory() as temp_output_dir:
-            trace_file_path = "/fake/dir/trace.log"
-            output_dir_path = temp_output_dir
+    @patch('log2files.process_xml_fragment')
+    def test_process_files(self, mock_process_xml_fragment):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_file_path = Path(temp_dir) / "trace.log"
+            trace_file_path.write_bytes(
+                b"header without timestamp <Element>ignored</Element>\n"
+                b"2024-07-31 12:34:56,789 INFO <Element>one</Element>\n"
+                b"<Element>t\xc3\xa9\r\nst</Element>\n"
+                b"2024-07-31 12:34:57,001 INFO <Element>two</Element>\n"
+            )
+            output_dir_path = Path(temp_dir) / "out"
             filtered_element_numbers = "12345"
             config = MagicMock()
+            config.XML_BYTES_PATTERN = re.compile(rb'<Element>.*?</Element>', re.DOTALL)
 
             process_files(trace_file_path, output_dir_path, filtered_element_numbers, config)
 
-            self.assertTrue(mock_open_obj.called)
-            self.assertTrue(mock_process_xml_content.called)
+            calls = [(c.args[0], c.args[4]) for c in mock_process_xml_fragment.call_args_list]
+            self.assertEqual(calls, [
+                ("<Element>one</Element>", "2024-07-31_12h34m56s789"),
+                ("<Element>t\u00e9\nst</Element>", "2024-07-31_12h34m56s789"),
+                ("<Element>two</Element>", "2024-07-31_12h34m57s001"),
+            ])
+
+    @patch('log2files.process_xml_fragment')
+    def test_process_files_empty_log(self, mock_process_xml_fragment):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_file_path = Path(temp_dir) / "trace.log"
+            trace_file_path.touch()
+
+            process_files(trace_file_path, Path(temp_dir) / "out", "", MagicMock())
+
+            mock_process_xml_fragment.assert_not_called()
 
     @patch('log2files.Config')
     @patch('log2files.process_files')
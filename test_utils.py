@@ -25,6 +25,7 @@ class TestConfig(unittest.TestCase):
         """Test that the configuration file is loaded correctly."""
         config = Config(self.config_path)
         self.assertEqual(config.XML_PATTERN.pattern, rf'<{self.config_data["markup_element_conf"]}>.*?</{self.config_data["markup_element_conf"]}>')
+        self.assertEqual(config.XML_BYTES_PATTERN.pattern, config.XML_PATTERN.pattern.encode('utf-8'))
         self.assertEqual(config.ELEMENT_REF_XPATH, f'.//{self.config_data["markup_date_conf"]}')
 
     def test_invalid_config_path(self):
@@ -11,4 +11,5 @@ class Config:
             config = json.load(config_file)
         
         self.XML_PATTERN = re.compile(rf'<{config["markup_element_conf"]}>.*?</{config["markup_element_conf"]}>', re.DOTALL)
+        self.XML_BYTES_PATTERN = re.compile(self.XML_PATTERN.pattern.encode('utf-8'), re.DOTALL)
         self.ELEMENT_REF_XPATH = f'.//{config["markup_date_conf"]}'